@@ -4,6 +4,8 @@ This script is a new version of how to create pipe modules with obstructions
 #%% ****************** 
 #   IMPORTED CLASSES
 #   ******************
+from multiprocessing import Process
+
 from src.TPZGmshToolkit import TPZGmshToolkit
 from src.TPZNoObstruction import TPZNoObstruction
 from src.TPZSimpleObstruction import TPZSimpleObstruction
@@ -65,12 +67,15 @@ def main()->None:
     # getting the model configuration (which surface is which)
     domains, inletSurface, outletSurface, obstructionSurfaces, wallSurfaces, orificeSurfaces = model.GetModelConfiguration()
 
+    noSlipSurfaces = wallSurfaces + inletSurface + outletSurface
+    boundarySurfaces = noSlipSurfaces + obstructionSurfaces
+
     # creating physical groups (domain and boundary conditions)
     model.CreatePhysicalGroups([
         {"entityDim":3, "entityTags":domains, "name":"Domain", "MaterialID":1},
         {"entityDim":2, "entityTags":inletSurface, "name":"PressIn", "MaterialID":2},
         {"entityDim":2, "entityTags":outletSurface, "name":"PressOut", "MaterialID":3},
-        {"entityDim":2, "entityTags":wallSurfaces + inletSurface + outletSurface, "name":"NoSlip", "MaterialID":4},
+        {"entityDim":2, "entityTags":noSlipSurfaces, "name":"NoSlip", "MaterialID":4},
         {"entityDim":2, "entityTags":wallSurfaces, "name":"NoPenetration", "MaterialID":5},
         {"entityDim":2, "entityTags":obstructionSurfaces, "name":"Obstruction", "MaterialID":100},
         {"entityDim":2, "entityTags":orificeSurfaces, "name":"Orifice", "MaterialID":200}
@@ -78,7 +83,7 @@ def main()->None:
 
     model.Show()
 
-    field1 = model.CreateConstantField(entitiesTags=wallSurfaces + inletSurface + outletSurface + obstructionSurfaces, meshSize=meshSize)
+    field1 = model.CreateConstantField(entitiesTags=boundarySurfaces, meshSize=meshSize)
     field2 = model.CreateConstantField(entitiesTags=orificeSurfaces, meshSize=meshSize/10)
 
     model.SetMinimumMeshSize([field1, field2])
@@ -87,10 +92,16 @@ def main()->None:
 
     TPZGmshToolkit.WriteMeshFiles(outputFile, ".msh")
 
+    # the VTK conversion only needs the .msh file, so it runs while gmsh is finalized
+    vtk = TPZVtkGenerator()
+    vtkProcess = Process(target=vtk.Do, args=(outputFile, f"{outputFile}.msh", ["MaterialID"]))
+    vtkProcess.start()
+
     TPZGmshToolkit.End()
 
-    vtk = TPZVtkGenerator()
-    vtk.Do(outputFile, f"{outputFile}.msh", ["MaterialID"])
+    vtkProcess.join()
+    if vtkProcess.exitcode != 0:
+        raise RuntimeError(f"VTK conversion of {outputFile}.msh failed")
 
     print(f"All done! Files {outputFile}.msh and {outputFile}.vtk created.")
 
@@ -14,22 +14,22 @@ class TPZBasicDataStructure(metaclass=ABCMeta):
     def DeactivateAttr(self) -> None:
         self.fDeactivateAttr = True
 
+        # names that can still be assigned, resolved once instead of on every assignment
+        object.__setattr__(self, '_fFrozenAttrs', frozenset(dir(self)))
+
     def ActivateAttr(self) -> None:
         self.fDeactivateAttr = False
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if not self.fDeactivateAttr:
-            super().__setattr__(name, value)
+        # the cache is missing when fDeactivateAttr was set by the constructor instead of DeactivateAttr
+        if not self.fDeactivateAttr or name in getattr(self, '_fFrozenAttrs', ()) or hasattr(self, name):
+            object.__setattr__(self, name, value)
 
         else:
-            if hasattr(self, name):
-                return super().__setattr__(name, value)
-            
-            else:
-                self.DebugStop(f"Cannot add new attribute '{name}' when attributes are deactivated.")
+            self.DebugStop(f"Cannot add new attribute '{name}' when attributes are deactivated.")
             
     def __str__(self):
-        fields = ', '.join(f"{key}={value}" for key, value in self.__dict__.items())
+        fields = ', '.join(f"{key}={value}" for key, value in self.__dict__.items() if not key.startswith('_'))
         return f"{self.__class__.__name__}({fields})"
     
     #   ****************** 
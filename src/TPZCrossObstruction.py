@@ -8,6 +8,8 @@ Created by Carlos Puga: 01/15/2024
 #%% ****************** 
 #   IMPORTED MODULES
 #   ******************
+from typing import ClassVar
+import numpy as np
 import gmsh
 
 from src.TPZModuleTypology import TPZModuleTypology
@@ -36,7 +38,16 @@ class TPZCrossObstruction(TPZModuleTypology):
 #   ****************** 
 #      INITIALIZOR
 #   ******************  
-    def __init__(self, length:float, lc:float, radius:float, obstructionWidth:float=0.5, obstructionHeight:float=0.5) -> None:
+    # coefficients of (width, tip radius) for x and of (height, tip radius) for y of each obstruction point
+    pointCoefficients: ClassVar[np.ndarray] = np.array([
+        [1, 0, 0, 0], [1, 0, 0, -1], [1, 1, 0, 0], [1, 0, 0, 1],
+        [0, 0, 1, 0], [0, 1, 1, 0], [0, 0, 1, 1], [0, -1, 1, 0],
+        [-1, 0, 0, 0], [-1, 0, 0, 1], [-1, -1, 0, 0], [-1, 0, 0, -1],
+        [0, 0, -1, 0], [0, -1, -1, 0], [0, 0, -1, -1], [0, 1, -1, 0],
+        [0, 1, 0, 1], [0, -1, 0, 1], [0, -1, 0, -1], [0, 1, 0, -1]
+    ], dtype=float)
+
+    def __init__(self, length:float, lc:float, radius:float, obstructionWidth:float=0.5, obstructionHeight:float=0.5, build:bool=True) -> None:
         super().__init__(length=length, lc=lc, radius=radius)
 
         self.fObstructionWidth: float = obstructionWidth
@@ -49,7 +60,8 @@ class TPZCrossObstruction(TPZModuleTypology):
 
         self.DeactivateAttr()
 
-        self.__post_init__()
+        if build:
+            self.__post_init__()
         
         return
 
@@ -64,8 +76,7 @@ class TPZCrossObstruction(TPZModuleTypology):
         """
         Checks whether the module is rectangular or circular 
         """
-        if (self.fObstructionWidth + self.fCrossTipRadius) > self.fRadius or (self.fObstructionHeight + self.fCrossTipRadius) > self.fRadius:
-            self.DebugStop('ERROR: obstruction radius not compatible with cylinder dimensions!')
+        self.CheckObstructionFits(max(self.fObstructionWidth, self.fObstructionHeight) + self.fCrossTipRadius)
 
         self.CreateCylinder()
         
@@ -82,9 +93,9 @@ class TPZCrossObstruction(TPZModuleTypology):
         obstruction = self.CreateObstruction()
 
         # calculating the boolean difference between the domain and the obstruction faces  
-        newSurfaces = gmsh.model.occ.fragment([(2, self.fObstructionSurface)], [(2, obstruction)])
+        newSurfaces = self.FragmentObstructionSurface([obstruction])
 
-        domainSurfaces = self.fSurfaces + [surface[1] for surface in newSurfaces[0]]
+        domainSurfaces = self.fSurfaces + newSurfaces
 
         # creating the module volume
         surfaceLoop = gmsh.model.occ.addSurfaceLoop(domainSurfaces)
@@ -105,34 +116,14 @@ class TPZCrossObstruction(TPZModuleTypology):
         r = self.fCrossTipRadius
         lc = self.fLC
 
-        pointCoords = [
-            [cx + dx, cy, l],
-            [cx + dx, cy - r, l],
-            [cx + dx + r, cy, l],
-            [cx + dx, cy + r, l],
-
-            [cx, cy + dy, l],
-            [cx + r, cy + dy, l],
-            [cx, cy + dy + r, l],
-            [cx - r, cy + dy, l],
-
-            [cx - dx, cy, l],
-            [cx - dx, cy + r, l],
-            [cx - dx - r, cy, l],
-            [cx - dx, cy - r, l],
-
-            [cx, cy - dy, l],
-            [cx - r, cy - dy, l],
-            [cx, cy - dy - r, l],
-            [cx + r, cy - dy, l],
-
-            [cx + r, cy + r, l],
-            [cx - r, cy + r, l],
-            [cx - r, cy - r, l],
-            [cx + r, cy - r, l]
-        ]
+        coefficients = self.pointCoefficients
+
+        pointCoords = np.empty((len(coefficients), 3))
+        pointCoords[:, 0] = cx + coefficients[:, :2] @ (dx, r)
+        pointCoords[:, 1] = cy + coefficients[:, 2:] @ (dy, r)
+        pointCoords[:, 2] = l
 
-        return TPZGmshToolkit.CreatePoints(pointCoords, lc)
+        return TPZGmshToolkit.CreatePointsArray(pointCoords, lc)
 
     def ObstructionArcs(self, points:list[int]) -> list[int]:
         """
@@ -174,10 +165,7 @@ class TPZCrossObstruction(TPZModuleTypology):
             obsLines += a
             obsLines += l
 
-        gmsh.model.occ.remove([(0, p1)])
-        gmsh.model.occ.remove([(0, p5)])
-        gmsh.model.occ.remove([(0, p9)])
-        gmsh.model.occ.remove([(0, p13)])
+        gmsh.model.occ.remove([(0, p1), (0, p5), (0, p9), (0, p13)]) # centers of the cross tips
 
         return obsLines
 
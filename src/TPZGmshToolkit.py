@@ -1,6 +1,7 @@
 from typing import ClassVar
 import json
 import gmsh
+import numpy as np
 import sys
 import os
 
@@ -31,41 +32,38 @@ class TPZGmshToolkit:
                 oldFile = fileName + extension
                 os.rename(oldFile, MeshNewPath+oldFile)
 
+    @staticmethod
+    def Factory():
+        """
+        Returns the gmsh geometry module (gmsh.model.occ or gmsh.model.geo) of the current kernel.
+        Resolve it once before creating many entities instead of checking the kernel for each one
+        """
+        return gmsh.model.occ if TPZGmshToolkit.kernel == 'occ' else gmsh.model.geo
+
     @staticmethod
     def CreatePoints(PointCoordinates: list[int], lc: float)->list[int]:
         """
         Return a list with the tags of the points created from 'PointCoordinates' with mesh size lc. 
         """
-        points = []
-        for coord in PointCoordinates:
-            x,y,z = coord
-            if TPZGmshToolkit.kernel == 'occ': 
-                p = gmsh.model.occ.addPoint(x,y,z,lc)
+        addPoint = TPZGmshToolkit.Factory().addPoint
 
-            elif TPZGmshToolkit.kernel == 'built':
-                p = gmsh.model.geo.addPoint(x,y,z,lc)
-            
-            points.append(p)
+        return [addPoint(x, y, z, lc) for x, y, z in PointCoordinates]
 
-        return points
+    @staticmethod
+    def CreatePointsArray(PointCoordinates: np.ndarray, lc: float)->list[int]:
+        """
+        Same as CreatePoints, but with the coordinates given as a (N, 3) array. 
+        """
+        return TPZGmshToolkit.CreatePoints(np.asarray(PointCoordinates, dtype=float).reshape(-1, 3).tolist(), lc)
 
     @staticmethod
     def CreateLines(LineIndexes: list[int])->list[int]:
         """
         Returns a list with the tags of the lines created from the indexes of points in 'LineIndexes'
         """
-        lines = []
-        for index in LineIndexes:
-            init, end = index
-            if TPZGmshToolkit.kernel == 'occ':
-                l = gmsh.model.occ.addLine(init, end)
-
-            elif TPZGmshToolkit.kernel == 'built':
-                l = gmsh.model.geo.addLine(init, end)
-
-            lines.append(l)
+        addLine = TPZGmshToolkit.Factory().addLine
 
-        return lines
+        return [addLine(init, end) for init, end in LineIndexes]
 
     @staticmethod
     def CreateCurveLoops(CurveLoopIndexes: list[int])->list[int]:
@@ -149,19 +147,12 @@ class TPZGmshToolkit:
 
     @staticmethod
     def CreateCircleArcs(arcPoints: list[int])->list[int]:
-        arcs = []
-        for coord in arcPoints:
-            start, center, end = coord
-
-            if TPZGmshToolkit.kernel == 'occ':
-                arc = gmsh.model.occ.addCircleArc(start, center, end)
-
-            elif TPZGmshToolkit.kernel == 'built':
-                arc = gmsh.model.occ.addCircleArc(start, center, end)
-
-            arcs.append(arc)
+        """
+        Returns a list with the tags of the circle arcs created from the (start, center, end) point tags in 'arcPoints'
+        """
+        addCircleArc = TPZGmshToolkit.Factory().addCircleArc
 
-        return arcs
+        return [addCircleArc(start, center, end) for start, center, end in arcPoints]
 
     @staticmethod
     def CreateCircles(Xcenter: float, Ycenter: float, Zcenter: float, Radius: float) -> int:
@@ -320,11 +311,26 @@ class TPZGmshToolkit:
         gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
 
     @staticmethod
-    def Begin():
+    def Begin(verbosity: int = 2):
         """
-        Initializes gmsh
+        Initializes gmsh. By default only warnings and errors are printed (see Verbose)
         """
         gmsh.initialize()
+        TPZGmshToolkit.Verbose(verbosity)
+
+    @staticmethod
+    def Verbose(level: int)->None:
+        """
+        Sets the gmsh verbosity level
+            0 -> silent
+            1 -> errors
+            2 -> warnings
+            3 -> direct
+            4 -> information
+            5 -> status
+            99 -> debug
+        """
+        gmsh.option.setNumber("General.Verbosity", level)
 
     @staticmethod
     def End():
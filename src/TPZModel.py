@@ -7,8 +7,10 @@ Created by Carlos Puga: 09/20/2025
 #%% ******************
 #   IMPORTED MODULES
 #   ******************
+from typing import ClassVar
 import gmsh 
 import sys
+import numpy as np
 
 from src.TPZSimpleObstruction import TPZSimpleObstruction
 from src.TPZGmshToolkit import TPZGmshToolkit
@@ -18,6 +20,9 @@ from src.TPZBasicDataStructure import TPZBasicDataStructure
 #   CLASS DEFINITION
 #   ******************
 class TPZModel(TPZBasicDataStructure):
+    # mandatory keys of each physical group given to CreatePhysicalGroups
+    physicalGroupKeys: ClassVar[frozenset[str]] = frozenset({"entityDim", "entityTags", "MaterialID"})
+
     def __init__(self, modules:list) -> None:
         super().__init__()
 
@@ -25,6 +30,7 @@ class TPZModel(TPZBasicDataStructure):
         self.fModules: list[TPZSimpleObstruction] = modules  
         self.fTotalLength: float = -1.0
         self.fEntities: dict = {}
+        self.fSurfacePoints: dict[int, list[int]] = {}
 
         self.DeactivateAttr()
 
@@ -55,51 +61,6 @@ class TPZModel(TPZBasicDataStructure):
 
         return
     
-    def DistanceToOrigin(self, x, y, z, planeXY=False) -> float:
-        """
-        Calculate the distance from a point to the origin.
-        3D distance by default, or 2D distance on the XY plane if plane
-
-        Inputs:
-        ------
-        x, y, z : float
-            Coordinates of the point.
-        planeXY : bool
-            If True, calculate distance on the XY plane.
-
-        Returns:
-        --------
-        float
-            Distance to the origin.
-        """
-        if planeXY:
-            return (x ** 2 + y ** 2) ** 0.5
-    
-        return (x ** 2 + y ** 2 + z ** 2) ** 0.5
-
-    def FindMidPoint(self, coords:list) -> tuple[float]:
-        """
-        Find the midpoint of a surface given its coordinates.
-        Inputs:
-        -------
-        surfaceCoords : list of tuples
-            List of (x, y, z) coordinates of the surface points.
-        Returns:
-        --------
-        tuple
-            (x, y, z) coordinates of the midpoint.
-        """
-        x = y = z = 0.0
-
-        for c in coords:
-            x += c[0]
-            y += c[1]
-            z += c[2]
-
-        sz = len(coords)
-
-        return (x/sz, y/sz, z/sz)
-
     def ExtractEntities(self) -> None:
         """
         Find and store all geometric entities in the model.
@@ -110,37 +71,60 @@ class TPZModel(TPZBasicDataStructure):
         volumes = gmsh.model.getEntities(dim=3)
         volumes = [v[1] for v in volumes]
 
+        # coordinates and XY distances of every model point, computed once and reused by all surfaces
+        modelPoints = [p[1] for p in gmsh.model.getEntities(dim=0)]
+        modelCoords = np.array([gmsh.model.getValue(0, p, []) for p in modelPoints]).reshape(-1, 3)
+        modelDistanceOnPlaneXY = np.hypot(modelCoords[:, 0], modelCoords[:, 1])
+
+        pointDistanceList = modelDistanceOnPlaneXY.tolist()
+
+        pointIndex = {p: i for i, p in enumerate(modelPoints)} # point tag -> row in the arrays above
+
+        # points of every surface, gathered from its curves. Each curve is queried only once,
+        # even though it is shared by the adjacent surfaces
+        curvePoints = {c[1]: gmsh.model.getAdjacencies(1, c[1])[1] for c in gmsh.model.getEntities(dim=1)}
+
+        self.fSurfacePoints = {
+            s[1]: list(dict.fromkeys(int(p) for c in gmsh.model.getAdjacencies(2, s[1])[1] for p in curvePoints[c]))
+            for s in gmsh.model.getEntities(dim=2)
+        }
+
         self.fEntities = {"volumes": []}
 
+        seenSurfaces = set() # surfaces already stored, so interfaces between modules are stored only once
+
         for v in volumes:
             volumes = {"id": v, "surfaces": []}
 
-            lastVolumeSurfaces = [s["id"] for s in self.fEntities["volumes"][-1]["surfaces"]] if self.fEntities["volumes"] else []
-
             volumeSurfaces = gmsh.model.getBoundary([(3, v)], oriented=False, recursive=False)
-            volumeSurfaces = [s[1] for s in volumeSurfaces if s[1] not in lastVolumeSurfaces]
+            volumeSurfaces = [s[1] for s in volumeSurfaces if s[1] not in seenSurfaces]
+
+            seenSurfaces.update(volumeSurfaces)
 
             for s in volumeSurfaces:
-                surface = {"id": s, "isOrifice": False, "pMidDistance": 0.0, "pMid": []}
+                surface = {"id": s, "isOrifice": False, "kind": "", "pMidDistance": 0.0, "pMid": []}
                 
-                surfacePoints = gmsh.model.getBoundary([(2, s)], oriented=False, recursive=True)
-                surfacePoints = [p[1] for p in surfacePoints]
-
-                pointDistanceOnPlaneXY = [self.DistanceToOrigin(*gmsh.model.getValue(0, p, []), planeXY=True) for p in surfacePoints]
+                surfacePoints = [pointIndex[p] for p in self.fSurfacePoints[s]]
 
-                if all(distance < radius for distance in pointDistanceOnPlaneXY):
+                # stops at the first point on (or beyond) the cylinder wall, which is the common case
+                if all(pointDistanceList[p] < radius for p in surfacePoints):
                     surface["isOrifice"] = True
+                    surface["kind"] = "orifice"
                     volumes["surfaces"].append(surface)
 
                     continue # no need to calculate mid point for orifice surfaces
 
-                elif any(distance < radius for distance in pointDistanceOnPlaneXY):
-                    surfacePoints = [p for p, dist in zip(surfacePoints, pointDistanceOnPlaneXY) if abs(dist - radius) < tol]
+                pointCoords = modelCoords[surfacePoints]
+                pointDistanceOnPlaneXY = modelDistanceOnPlaneXY[surfacePoints]
+
+                if np.any(pointDistanceOnPlaneXY < radius):
+                    pointCoords = pointCoords[np.abs(pointDistanceOnPlaneXY - radius) < tol]
 
-                pointCoords = [gmsh.model.getValue(0, p, []) for p in surfacePoints] # initialize with first point
+                pMid = pointCoords.mean(axis=0)
 
-                surface["pMid"] = self.FindMidPoint(pointCoords)
-                surface["pMidDistance"] = self.DistanceToOrigin(*surface["pMid"])
+                surface["pMid"] = tuple(pMid.tolist())
+                surface["pMidDistance"] = float(np.linalg.norm(pMid))
+                surface["kind"] = self.SurfaceKind(surface["pMid"], tol)
 
                 volumes["surfaces"].append(surface)
 
@@ -148,6 +132,35 @@ class TPZModel(TPZBasicDataStructure):
 
         return 
     
+    def SurfaceKind(self, pMid:tuple[float], tol:float) -> str:
+        """
+        Classify a non-orifice surface from its midpoint.
+
+        Inputs:
+        -------
+        pMid : tuple
+            (x, y, z) coordinates of the surface midpoint.
+        tol : float
+            Tolerance used on the coordinate comparisons.
+
+        Returns:
+        --------
+        str
+            "wall", "inlet", "outlet" or "obstruction"
+        """
+        x, y, z = pMid
+
+        if abs(x) > tol or abs(y) > tol:
+            return "wall"
+
+        if abs(z) < tol:
+            return "inlet"
+
+        if abs(z - self.fTotalLength) < tol:
+            return "outlet"
+
+        return "obstruction"
+
     def GetModelConfiguration(self) -> tuple[list[int], list[int], list[int], list[int], list[int], list[int]]:
         """
         Get the configuration of the model, classifying surfaces into different categories.
@@ -158,33 +171,19 @@ class TPZModel(TPZBasicDataStructure):
             (domains, inletSurface, outletSurface, obstructionSurfaces, wallSurfaces, orificeSurfaces)
         """
         domains = []
-        inletSurface = []
-        outletSurface = []
-        obstructionSurfaces = []
-        wallSurfaces = []
-        orificeSurfaces = []
+        surfaces = {"inlet": [], "outlet": [], "obstruction": [], "wall": [], "orifice": []}
 
         for v in self.fEntities["volumes"]:
             domains.append(v["id"])
 
             for surface in v["surfaces"]: 
+                surfaces[surface["kind"]].append(surface["id"])
 
-                if surface["isOrifice"]:
-                    orificeSurfaces.append(surface["id"])
-                    continue
-
-                match  surface["pMid"]:
-                    case [0, 0, 0]:
-                        inletSurface.append(surface["id"])
-
-                    case [0, 0, z] if z == self.fTotalLength:
-                        outletSurface.append(surface["id"])
-
-                    case [0, 0, z]:
-                        obstructionSurfaces.append(surface["id"])
-
-                    case _:
-                        wallSurfaces.append(surface["id"])
+        inletSurface = surfaces["inlet"]
+        outletSurface = surfaces["outlet"]
+        obstructionSurfaces = surfaces["obstruction"]
+        wallSurfaces = surfaces["wall"]
+        orificeSurfaces = surfaces["orifice"]
 
         if not domains:
             self.DebugStop("No volumes found")
@@ -215,12 +214,14 @@ class TPZModel(TPZBasicDataStructure):
             Each list element must have: ["entityDim", "entityTags", "MaterialID"] as mandatory keys. 
             The key "name" is optional.
         """
-        keys = ["entityDim", "entityTags", "MaterialID"]
-        if not all(all(key in phGr for key in keys) for phGr in physicalGroups):
-            self.DebugStop(f"Physical groups must contain the following keys: {keys}")
+        keys = self.physicalGroupKeys
+
+        invalid = next((phGr for phGr in physicalGroups if not keys.issubset(phGr)), None)
+        if invalid is not None:
+            self.DebugStop(f"Physical groups must contain the following keys: {sorted(keys)}. Found: {list(invalid)}")
 
         for phGr in physicalGroups:
-            gmsh.model.addPhysicalGroup(phGr["entityDim"], phGr["entityTags"], phGr["MaterialID"], name=phGr["name"])
+            gmsh.model.addPhysicalGroup(phGr["entityDim"], phGr["entityTags"], phGr["MaterialID"], name=phGr.get("name", ""))
 
         return
     
@@ -6,6 +6,10 @@ Created by Carlos Puga: 01/13/2024
 #%% ****************** 
 #   IMPORTED MODULES
 #   ******************
+from typing import ClassVar
+from itertools import chain
+from operator import itemgetter
+import numpy as np
 import gmsh
 
 from src.TPZGmshToolkit import TPZGmshToolkit
@@ -31,10 +35,16 @@ class TPZModuleTypology(TPZBasicDataStructure):
         - obstructionSurface: module's surface on which the obstruction 
         will be inserted
         - volumeID: module's volume identification (provided by the class itself)
+
+    The typologies take a 'build' flag (True by default). With build=False the 
+    geometry is only created by an explicit CreateDomain call.
     """
 #   ****************** 
 #      INITIALIZOR
 #   ******************  
+    # center followed by the +x, +y, -x and -y points of a circle with unit radius
+    circleDirections: ClassVar[np.ndarray] = np.array([[0, 0], [1, 0], [0, 1], [-1, 0], [0, -1]], dtype=float)
+
     def __init__(self, length: float, lc: float, radius:float) -> None:
             self.fLength: float = length
             self.fLC: float = lc
@@ -51,22 +61,51 @@ class TPZModuleTypology(TPZBasicDataStructure):
 #   ****************** 
 #       CYLINDER
 #   ******************  
-    def CylinderPoints(self) -> None:   
+    def CircleCoordinates(self, cx: float, cy: float, radius: float, z: float) -> np.ndarray:
         """
-        Creates the points of the cylinder inlet surface
+        Returns a (5, 3) array with the center and the four quadrant points 
+        (+x, +y, -x, -y) of a circle in the plane 'z'
         """
-        radius = self.fRadius
+        coords = np.empty((len(self.circleDirections), 3))
+        coords[:, :2] = radius * self.circleDirections + (cx, cy)
+        coords[:, 2] = z
 
-        pointsCoords = [
-            [0, 0, 0],
-            [radius, 0, 0],
-            [0, radius, 0],
-            [-radius, 0, 0],
-            [0, -radius, 0],
+        return coords
 
+    def CreateDisk(self, cx: float, cy: float, radius: float, z: float, centers: list[int] = None) -> int:
+        """
+        Returns the surface id of a disk with center (cx, cy, z) and 'radius'. If 'centers' 
+        is given, the disk center point is appended to it instead of being removed, so the 
+        caller can remove all the centers at once
+        """
+        occ = gmsh.model.occ
+        addPoint = occ.addPoint
+        addCircleArc = occ.addCircleArc
+        lc = self.fLC
+
+        p1, p2, p3, p4, p5 = [addPoint(x, y, z, lc) for x, y, z in self.CircleCoordinates(cx, cy, radius, z).tolist()]
+
+        arcs = [
+            addCircleArc(p2, p1, p3),
+            addCircleArc(p3, p1, p4),
+            addCircleArc(p4, p1, p5),
+            addCircleArc(p5, p1, p2)
         ]
 
-        self.fPoints = TPZGmshToolkit.CreatePoints(pointsCoords, self.fLC)
+        if centers is None:
+            occ.remove([(0, p1)])
+        else:
+            centers.append(p1)
+
+        return occ.addPlaneSurface([occ.addCurveLoop(arcs)])
+
+    def CylinderPoints(self) -> None:   
+        """
+        Creates the points of the cylinder inlet surface
+        """
+        pointsCoords = self.CircleCoordinates(0., 0., self.fRadius, 0.)
+
+        self.fPoints = TPZGmshToolkit.CreatePointsArray(pointsCoords, self.fLC)
 
         return 
 
@@ -108,11 +147,29 @@ class TPZModuleTypology(TPZBasicDataStructure):
 
         contour = gmsh.model.occ.addThruSections([back, front], makeSolid=False)
 
-        self.fSurfaces = [back] + [c[1] for c in contour]
+        self.fSurfaces = [back, *map(itemgetter(1), contour)]
         self.fObstructionSurface = front
 
         return 
 
+    def CheckObstructionFits(self, extent: float) -> None:
+        """
+        Stops if an obstruction reaching 'extent' from the module axis does not fit the cylinder
+        """
+        if extent > self.fRadius:
+            self.DebugStop('ERROR: obstruction radius not compatible with cylinder dimensions!')
+
+        return
+
+    def FragmentObstructionSurface(self, obstructions: list[int]) -> list[int]:
+        """
+        Splits the obstruction surface with the 'obstructions' surfaces. 
+        Returns the resulting surfaces: the pieces of the obstruction surface 
+        followed by the pieces of each obstruction, as given by the fragment map
+        """
+        _, fragmentMap = gmsh.model.occ.fragment([(2, self.fObstructionSurface)], [(2, obs) for obs in obstructions], removeObject=True, removeTool=True)
+
+        return list(dict.fromkeys(map(itemgetter(1), chain.from_iterable(fragmentMap))))
 
     def CreateCylinder(self)->None:
         """
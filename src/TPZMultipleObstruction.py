@@ -8,11 +8,11 @@ Created by Carlos Puga: 01/15/2024
 #%% ****************** 
 #   IMPORTED MODULES
 #   ******************
+from typing import ClassVar
 import numpy as np
 import gmsh
 
 from src.TPZModuleTypology import TPZModuleTypology
-from src.TPZGmshToolkit import TPZGmshToolkit
 
 #%% ****************** 
 #   CLASS DEFINITION
@@ -34,7 +34,12 @@ class TPZMultipleObstruction(TPZModuleTypology):
 #   ****************** 
 #      INITIALIZOR
 #   ******************  
-    def __init__(self, length:float, lc:float, radius:float, obstructionRadius:float, obstructionDistance:float) -> None:
+    # angular position of the obstructions placed around the center one
+    obstructionAngles: ClassVar[np.ndarray] = np.deg2rad(np.arange(0, 360, 45))
+    obstructionCos: ClassVar[np.ndarray] = np.cos(obstructionAngles)
+    obstructionSin: ClassVar[np.ndarray] = np.sin(obstructionAngles)
+
+    def __init__(self, length:float, lc:float, radius:float, obstructionRadius:float, obstructionDistance:float, build:bool=True) -> None:
         super().__init__(length=length, lc=lc, radius=radius)
         
         self.fObstructionRadius: float = obstructionRadius
@@ -44,7 +49,8 @@ class TPZMultipleObstruction(TPZModuleTypology):
 
         self.DeactivateAttr()
 
-        self.__post_init__()
+        if build:
+            self.__post_init__()
 
         return
 
@@ -57,8 +63,7 @@ class TPZMultipleObstruction(TPZModuleTypology):
 #   ******************  
     def CheckTypology(self)->None:
 
-        if (self.fObstructionRadius + self.fObstructionDistance) > self.fRadius:
-            self.DebugStop('ERROR: obstruction radius not compatible with cylinder dimensions!')
+        self.CheckObstructionFits(self.fObstructionRadius + self.fObstructionDistance)
 
         self.CreateCylinder()
 
@@ -74,9 +79,9 @@ class TPZMultipleObstruction(TPZModuleTypology):
         obstructions = self.CreateObstruction()
 
         # calculating the boolean difference between the domain and the obstruction faces  
-        newSurfaces = gmsh.model.occ.fragment([(2, self.fObstructionSurface)], [(2, obs) for obs in obstructions])
+        newSurfaces = self.FragmentObstructionSurface(obstructions)
 
-        domainSurfaces = self.fSurfaces + [surface[1] for surface in newSurfaces[0]]
+        domainSurfaces = self.fSurfaces + newSurfaces
         # creating the module volume
         surfaceLoop = gmsh.model.occ.addSurfaceLoop(domainSurfaces)
 
@@ -87,73 +92,27 @@ class TPZMultipleObstruction(TPZModuleTypology):
 #   ****************** 
 #        OBSTRUCTION
 #   ******************  
-    def ObstructionPoints(self) -> list[int]:
-        """
-        Returns the points belonging to the obstruction
-        """
-        cx = self.fObstructionCX
-        cy = self.fObstructionCY
-        r = self.fObstructionRadius
-        l = self.fLength
-        lc = self.fLC
-
-        pointCoords = [
-            [cx, cy, l],
-            [cx + r, cy, l],
-            [cx, cy + r, l],
-            [cx - r, cy, l],
-            [cx, cy - r, l]
-        ]
-
-        return TPZGmshToolkit.CreatePoints(pointCoords, lc)
-
-    def ObstructionArcs(self, points: list[int]) -> list[int]:
-        """
-        Returns the lines belonging to the obstruction
-        """
-        p1, p2, p3, p4, p5 = points
-
-        arcPoints = [
-            [p2, p1, p3],
-            [p3, p1, p4],
-            [p4, p1, p5],
-            [p5, p1, p2]
-        ]
-
-        ob_arcs = TPZGmshToolkit.CreateCircleArcs(arcPoints)
-
-        gmsh.model.occ.remove([(0, p1)])
-
-        return ob_arcs
-
     def CreateObstruction(self) -> list[int]:
         """
         Returns the obstruction surface id
         """
-        angles = [0,45,90,135,180,225,270,315]
-        
-        originX = self.fObstructionCX
-        originY = self.fObstructionCY
         r = self.fObstructionDistance
 
-        multipleObs = []
+        # the obstructions around the center one are translated copies of it
+        offsetsX = (r*self.obstructionCos).tolist()
+        offsetsY = (r*self.obstructionSin).tolist()
 
-        centerPoints = self.ObstructionPoints()
-        centerArcs = self.ObstructionArcs(centerPoints)
-        centerCurves = gmsh.model.occ.addCurveLoop(centerArcs)        
-        centerSurface = gmsh.model.occ.addPlaneSurface([centerCurves])
+        centerSurface = self.CreateDisk(self.fObstructionCX, self.fObstructionCY, self.fObstructionRadius, self.fLength)
 
-        multipleObs.append(centerSurface)
+        multipleObs = [centerSurface]
 
-        for theta in angles:
-            self.fObstructionCX = r*np.cos(np.deg2rad(theta)) + originX
-            self.fObstructionCY = r*np.sin(np.deg2rad(theta)) + originY
+        copy = gmsh.model.occ.copy
+        translate = gmsh.model.occ.translate
 
-            points = self.ObstructionPoints()
-            arcs = self.ObstructionArcs(points) 
-            curves = gmsh.model.occ.addCurveLoop(arcs)
-            circleSurface = gmsh.model.occ.addPlaneSurface([curves])
+        for dx, dy in zip(offsetsX, offsetsY):
+            circleSurface = copy([(2, centerSurface)])
+            translate(circleSurface, dx, dy, 0)
 
-            multipleObs.append(circleSurface)
+            multipleObs.append(circleSurface[0][1])
 
         return multipleObs
\ No newline at end of file
@@ -27,10 +27,11 @@ class TPZNoObstruction(TPZModuleTypology):
 #   ****************** 
 #      INITIALIZOR
 #   ******************  
-    def __init__(self, length:float, lc:float, radius:float) -> None:
+    def __init__(self, length:float, lc:float, radius:float, build:bool=True) -> None:
         super().__init__(length=length, lc=lc, radius=radius)
 
-        self.__post_init__()
+        if build:
+            self.__post_init__()
 
         return
 
@@ -47,10 +48,31 @@ class TPZNoObstruction(TPZModuleTypology):
         """
         self.CreateCylinder()
 
-        domainSurfaces = self.fSurfaces + [self.fObstructionSurface]
+        domainSurfaces = [*self.fSurfaces, self.fObstructionSurface]
 
         # creating the module volume
         surfaceLoop = gmsh.model.occ.addSurfaceLoop(domainSurfaces)
         self.fVolumeID = gmsh.model.occ.addVolume([surfaceLoop])
 
-        return
\ No newline at end of file
+        return
+
+    @classmethod
+    def BuildMany(cls, parameters: list[dict]) -> list["TPZNoObstruction"]:
+        """
+        Returns a list of modules without obstructions, one for each set of keyword arguments 
+        (length, lc, radius) in 'parameters'. All the cylinders are created first and the 
+        module volumes afterwards, in a single pass.
+        """
+        modules = [cls(**kwargs, build=False) for kwargs in parameters]
+
+        for module in modules:
+            module.CreateCylinder()
+
+        addSurfaceLoop = gmsh.model.occ.addSurfaceLoop
+        addVolume = gmsh.model.occ.addVolume
+
+        for module in modules:
+            surfaceLoop = addSurfaceLoop([*module.fSurfaces, module.fObstructionSurface])
+            module.fVolumeID = addVolume([surfaceLoop])
+
+        return modules
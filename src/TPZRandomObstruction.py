@@ -9,12 +9,9 @@ Created by Carlos Puga: 01/15/2024
 #   IMPORTED MODULES
 #   ******************
 import gmsh
-import random
 import numpy as np
-from datetime import datetime
 
 from src.TPZModuleTypology import TPZModuleTypology
-from src.TPZGmshToolkit import TPZGmshToolkit
 
 #%% ****************** 
 #   CLASS DEFINITION
@@ -32,11 +29,13 @@ class TPZRandomObstruction(TPZModuleTypology):
         - fNumberOfObstructions: maximum number of obstructions
         - fObstructionCX: x coordinate to place the obstruction
         - fObstructionCY: y coordinate to place the obstruction
+        - fRng: random generator used to place the obstructions, seeded with 'seed' 
+        (OS entropy if no seed is given)
     """
 #   ****************** 
 #      INITIALIZOR
 #   ******************  
-    def __init__(self, length: float, lc: float, radius: float, obstructionRadius: float, nObstructions: int, seed: int = None) -> None:
+    def __init__(self, length: float, lc: float, radius: float, obstructionRadius: float, nObstructions: int, seed: int = None, build: bool = True) -> None:
         super().__init__(length=length, lc=lc, radius=radius)
 
         self.fObstructionRadius: float = obstructionRadius
@@ -44,10 +43,12 @@ class TPZRandomObstruction(TPZModuleTypology):
         self.fSeed: int = seed
         self.fObstructionCX: float = 0.0
         self.fObstructionCY: float = 0.0
+        self.fRng: np.random.Generator = np.random.default_rng(seed)
 
         self.DeactivateAttr()
 
-        self.__post_init__()
+        if build:
+            self.__post_init__()
 
         return
 
@@ -76,23 +77,14 @@ class TPZRandomObstruction(TPZModuleTypology):
         obstructions = self.CreateObstruction()
 
         # calculating the boolean difference between the domain and the obstruction faces  
-        newSurfaces = gmsh.model.occ.fragment([(2, self.fObstructionSurface)], [(2, obs) for obs in obstructions])
+        newSurfaces = self.FragmentObstructionSurface(obstructions)
 
-        domainSurfaces = self.fSurfaces + [surface[1] for surface in newSurfaces[0]]
+        domainSurfaces = self.fSurfaces + newSurfaces
 
         # creating the module volume
         surfaceLoop = gmsh.model.occ.addSurfaceLoop(domainSurfaces)
         self.fVolumeID = gmsh.model.occ.addVolume([surfaceLoop])
 
-    def EuclideanDistance(self, xa: float, ya: float, xb: float, yb: float)->float:
-        """
-        Returns the euclidean distance between the points (xa, ya) and (xb, yb)
-        """
-        Xa = np.array([xa, ya])
-        Xb = np.array([xb, yb])
-
-        return np.linalg.norm(Xa - Xb)
-
     def GetObstructionDomain(self) -> list[float]:
         """
         Returns the domain range in which the obstructions can be inserted
@@ -105,68 +97,51 @@ class TPZRandomObstruction(TPZModuleTypology):
 
         Return: circleList
         """
-        counter = 0
-        circleList = []
+        nCircles = self.fNumberOfObstructions
+        maxTrials = 1000
+        batchSize = 256
 
         domX, domY = self.GetObstructionDomain()
 
-        random.seed(self.fSeed) if self.fSeed is not None else random.seed(datetime.now().timestamp())
-
-        while len(circleList) < self.fNumberOfObstructions and counter < 1000:
-            counter += 1
+        # distances are compared squared
+        minDistanceSq = (2.5 * self.fObstructionRadius) ** 2
+        maxRadiusSq = (.75 * self.fRadius) ** 2
 
-            xMult = (-1) ** random.randint(0, 1)
-            yMult = (-1) ** random.randint(0, 1)
+        rng = self.fRng
 
-            x = (xMult) * random.uniform(0, domX)
-            y = (yMult) * random.uniform(0, domY)
-
-            if not any((Xcenter, Ycenter) for Xcenter, Ycenter in circleList if self.EuclideanDistance(x, y, Xcenter, Ycenter) < 2.5 * self.fObstructionRadius):
-                if (x) ** 2 + (y) ** 2 < (.75 * self.fRadius) ** 2: circleList.append((x, y))
-
-        return circleList
+        circles = np.empty((nCircles, 2))
+        nAccepted = 0
+        counter = 0
 
-#   ****************** 
-#        OBSTRUCTION
-#   ******************  
-    def ObstructionPoints(self)->tuple[int]:
-        """
-        Returns the points belonging to the obstruction
-        """
-        cx, cy = self.fObstructionCX, self.fObstructionCY
-        r = self.fObstructionRadius
-        l = self.fLength
-        lc = self.fLC
+        while nAccepted < nCircles and counter < maxTrials:
+            nCandidates = min(batchSize, maxTrials - counter)
+            counter += nCandidates
 
-        pointCoords = [
-            [cx, cy, l],
-            [cx + r, cy, l],
-            [cx, cy + r, l],
-            [cx - r, cy, l],
-            [cx, cy - r, l]
-        ]
+            candidates = rng.uniform((-domX, -domY), (domX, domY), size=(nCandidates, 2))
 
-        return TPZGmshToolkit.CreatePoints(pointCoords, lc)
+            # candidates outside the allowed radius or overlapping the accepted circles
+            candidates = candidates[(candidates ** 2).sum(axis=1) < maxRadiusSq]
 
-    def ObstructionArcs(self, points: list[int])->tuple[int]:
-        """
-        Returns the lines belonging to the obstruction
-        """
-        p1, p2, p3, p4, p5 = points
+            if nAccepted:
+                distanceSq = ((candidates[:, None, :] - circles[None, :nAccepted, :]) ** 2).sum(axis=2)
+                candidates = candidates[np.all(distanceSq >= minDistanceSq, axis=1)]
 
-        arcPoints = [
-            [p2, p1, p3],
-            [p3, p1, p4],
-            [p4, p1, p5],
-            [p5, p1, p2]
-        ]
+            # the remaining candidates may still overlap each other, so they are accepted one at a time
+            for candidate in candidates:
+                if nAccepted == nCircles:
+                    break
 
-        obArcs = TPZGmshToolkit.CreateCircleArcs(arcPoints)
+                if np.any(((circles[:nAccepted] - candidate) ** 2).sum(axis=1) < minDistanceSq):
+                    continue
 
-        gmsh.model.occ.remove([(0, p1)])
+                circles[nAccepted] = candidate
+                nAccepted += 1
 
-        return obArcs
+        return [tuple(circle) for circle in circles[:nAccepted].tolist()]
 
+#   ****************** 
+#        OBSTRUCTION
+#   ******************  
     def CreateObstruction(self)->int:
         """
         Returns the obstruction surface id
@@ -176,21 +151,14 @@ class TPZRandomObstruction(TPZModuleTypology):
         
         obstruction_coordinates = self.NoOverlappingCircles()
 
-        obstructions = []
-
-        for coordinates in obstruction_coordinates:
-            dx, dy = coordinates
+        r = self.fObstructionRadius
+        l = self.fLength
 
-            self.fObstructionCX = originX + dx
-            self.fObstructionCY = originY + dy
+        createDisk = self.CreateDisk
 
-            obPoints = self.ObstructionPoints()
-            obArc = self.ObstructionArcs(obPoints)
-            
-            curve = gmsh.model.occ.addCurveLoop(obArc)
-            
-            obstructionSurface = gmsh.model.occ.addPlaneSurface([curve])
+        centerPoints = []
+        obstructions = [createDisk(originX + dx, originY + dy, r, l, centerPoints) for dx, dy in obstruction_coordinates]
 
-            obstructions.append(obstructionSurface)
+        gmsh.model.occ.remove([(0, p) for p in centerPoints])
 
-        return obstructions
\ No newline at end of file
+        return obstructions
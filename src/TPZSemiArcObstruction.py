@@ -9,8 +9,9 @@ Created by Carlos Puga: 01/15/2024
 #   IMPORTED MODULES
 #   ******************
 from typing import ClassVar
-import numpy as np
+import math
 import gmsh
+import numpy as np
 
 from src.TPZModuleTypology import TPZModuleTypology
 from src.TPZGmshToolkit import TPZGmshToolkit
@@ -36,7 +37,42 @@ class TPZSemiArcObstruction(TPZModuleTypology):
 #   ******************  
     multiplicativeConstant:ClassVar = 1.2
 
-    def __init__(self, length:float, lc:float, radius:float, obstructionRadius:float) -> None:
+    # directions of the semi arcs' end points
+    cos60: ClassVar[float] = math.cos(math.radians(60))
+    sin60: ClassVar[float] = math.sin(math.radians(60))
+    cos30: ClassVar[float] = math.cos(math.radians(30))
+    sin30: ClassVar[float] = math.sin(math.radians(30))
+
+    # directions of the 17 obstruction points from its center and their distance to it, 
+    # in units of the obstruction radius (the outer end points of the semi arcs are scaled by 
+    # multiplicativeConstant)
+    unitDirections: ClassVar[np.ndarray] = np.array([
+        (0., 0.),
+
+        (cos60, sin60), (cos60, sin60), (-cos60, sin60), (-cos60, sin60),
+        (cos60, -sin60), (cos60, -sin60), (-cos60, -sin60), (-cos60, -sin60),
+
+        (cos30, sin30), (cos30, sin30), (cos30, -sin30), (cos30, -sin30),
+        (-cos30, sin30), (-cos30, sin30), (-cos30, -sin30), (-cos30, -sin30)
+    ])
+    unitDistances: ClassVar[np.ndarray] = np.array([
+        1.,
+        1., multiplicativeConstant, multiplicativeConstant, 1.,
+        1., multiplicativeConstant, 1., multiplicativeConstant,
+        1., multiplicativeConstant, 1., multiplicativeConstant,
+        1., multiplicativeConstant, 1., multiplicativeConstant
+    ])[:, None]
+
+    # boundary of each semi arc, as indices of the ObstructionPoints list: 
+    # line (start, end), arc (start, center, end), line, arc
+    boundaryIndices: ClassVar[tuple] = (
+        ((1, 2), (2, 0, 3), (3, 4), (4, 0, 1)),
+        ((6, 5), (5, 0, 7), (7, 8), (8, 0, 6)),
+        ((11, 12), (12, 0, 10), (10, 9), (9, 0, 11)),
+        ((13, 14), (14, 0, 16), (16, 15), (15, 0, 13))
+    )
+
+    def __init__(self, length:float, lc:float, radius:float, obstructionRadius:float, build:bool=True) -> None:
         super().__init__(length=length, lc=lc, radius=radius)
 
         self.fObstructionRadius: float = obstructionRadius
@@ -45,7 +81,8 @@ class TPZSemiArcObstruction(TPZModuleTypology):
 
         self.DeactivateAttr()
 
-        self.__post_init__()
+        if build:
+            self.__post_init__()
 
         return
 
@@ -60,8 +97,7 @@ class TPZSemiArcObstruction(TPZModuleTypology):
         """
         Checks whether the module is rectangular or circular 
         """
-        if self.fObstructionRadius > self.fRadius:
-            self.DebugStop('ERROR: obstruction radius not compatible with cylinder dimensions!')
+        self.CheckObstructionFits(self.fObstructionRadius)
 
         self.CreateCylinder()
 
@@ -77,9 +113,9 @@ class TPZSemiArcObstruction(TPZModuleTypology):
         obstruction = self.CreateObstruction()
 
         # calculating the boolean difference between the domain and the obstruction faces  
-        newSurfaces = gmsh.model.occ.fragment([(2, self.fObstructionSurface)], [(2, obs) for obs in obstruction])
+        newSurfaces = self.FragmentObstructionSurface(obstruction)
 
-        domainSurfaces = self.fSurfaces + [surface[1] for surface in newSurfaces[0]]
+        domainSurfaces = self.fSurfaces + newSurfaces
 
         # creating the module volume
         surfaceLoop = gmsh.model.occ.addSurfaceLoop(domainSurfaces)
@@ -98,68 +134,30 @@ class TPZSemiArcObstruction(TPZModuleTypology):
         r = self.fObstructionRadius
         l = self.fLength
         lc = self.fLC
-        cons = self.multiplicativeConstant
-
-        dx = r * np.cos(np.deg2rad(60))
-        dy = r * np.sin(np.deg2rad(60))
-
-        pointsCoord = [
-            [cx, cy, l],
-
-            [cx + dx, cy + dy, l],
-            [cx + cons * dx, cy + cons * dy, l],
-            [cx - cons * dx, cy + cons * dy, l],
-            [cx - dx, cy + dy, l],
-            
-            [cx + dx, cy - dy, l],
-            [cx + cons * dx, cy - cons * dy, l],
-            [cx - dx, cy - dy, l],
-            [cx - cons * dx, cy - cons * dy, l]
-        ]
-
-        dx = r * np.cos(np.deg2rad(30))
-        dy = r * np.sin(np.deg2rad(30))
-
-        pointsCoord += [
-            [cx + dx, cy + dy, l],
-            [cx + cons * dx, cy + cons * dy, l],
-            [cx + dx, cy - dy, l],
-            [cx + cons * dx, cy - cons * dy, l],
-
-            [cx - dx, cy + dy, l],
-            [cx - cons * dx, cy + cons * dy, l],
-            [cx - dx, cy - dy, l],
-            [cx - cons * dx, cy - cons * dy, l]
-        ]
-
-        return TPZGmshToolkit.CreatePoints(pointsCoord, lc)
+
+        pointsCoord = np.empty((len(self.unitDirections), 3))
+        pointsCoord[:, :2] = (r * self.unitDirections) * self.unitDistances + (cx, cy)
+        pointsCoord[:, 2] = l
+
+        return TPZGmshToolkit.CreatePointsArray(pointsCoord, lc)
 
     def ObstructionArcs(self, points: list[int])->list[int]:
         """
         Returns the lines belonging to the obstruction
         """
-        p1, p2, p3, p4, p5, p6, p7, p8, p9, p10, p11, p12, p13, p14, p15, p16, p17 = points
-
-        linePoints = [
-            [[p2, p3], [p3, p1, p4], [p4, p5], [p5, p1, p2]],
-            [[p7, p6], [p6, p1, p8], [p8, p9], [p9, p1, p7]],
-            [[p12, p13], [p13, p1, p11], [p11, p10], [p10, p1, p12]],
-            [[p14, p15], [p15, p1, p17], [p17, p16], [p16, p1, p14]]
-        ]
+        addLine = gmsh.model.occ.addLine
+        addCircleArc = gmsh.model.occ.addCircleArc
 
         obArcs = []
-        for group in linePoints:
-            g1, g2, g3, g4 = group
-            
-            arc = []
-            arc.append(gmsh.model.occ.addLine(g1[0], g1[1]))
-            arc.append(gmsh.model.occ.addCircleArc(g2[0], g2[1], g2[2]))
-            arc.append(gmsh.model.occ.addLine(g3[0], g3[1]))
-            arc.append(gmsh.model.occ.addCircleArc(g4[0], g4[1], g4[2]))
-
-            obArcs.append(arc)
-
-        gmsh.model.occ.remove([(0, p1)])
+        for (a, b), (c, d, e), (f, g), (h, i, j) in self.boundaryIndices:
+            obArcs.append([
+                addLine(points[a], points[b]),
+                addCircleArc(points[c], points[d], points[e]),
+                addLine(points[f], points[g]),
+                addCircleArc(points[h], points[i], points[j])
+            ])
+
+        gmsh.model.occ.remove([(0, points[0])])
 
         return obArcs
 
@@ -11,7 +11,6 @@ Created by Carlos Puga: 01/13/2024
 import gmsh
 
 from src.TPZModuleTypology import TPZModuleTypology
-from src.TPZGmshToolkit import TPZGmshToolkit
 
 #%% ****************** 
 #   CLASS DEFINITION
@@ -32,7 +31,7 @@ class TPZSimpleObstruction(TPZModuleTypology):
 #   ****************** 
 #      INITIALIZER
 #   ******************  
-    def __init__(self, length:float, lc:float, radius:float, obstructionRadius:float) -> None: 
+    def __init__(self, length:float, lc:float, radius:float, obstructionRadius:float, build:bool=True) -> None: 
         super().__init__(length=length, lc=lc, radius=radius)
 
         self.fObstructionRadius: float = obstructionRadius
@@ -42,7 +41,8 @@ class TPZSimpleObstruction(TPZModuleTypology):
 
         self.DeactivateAttr()
 
-        self.__post_init__()
+        if build:
+            self.__post_init__()
 
         return
 
@@ -58,8 +58,7 @@ class TPZSimpleObstruction(TPZModuleTypology):
         """
         Checks whether the module's typology and geometry 
         """
-        if self.fObstructionRadius > self.fRadius:
-            self.DebugStop('ERROR: obstruction radius not compatible with cylinder dimensions!')
+        self.CheckObstructionFits(self.fObstructionRadius)
 
         self.CreateCylinder()
 
@@ -75,10 +74,10 @@ class TPZSimpleObstruction(TPZModuleTypology):
         obstruction = self.CreateObstruction()
 
         # calculating the boolean difference between the domain and the obstruction faces  
-        newSurfaces = gmsh.model.occ.fragment([(2, self.fObstructionSurface)], [(2, obstruction)])
+        newSurfaces = self.FragmentObstructionSurface([obstruction])
 
         self.fObstructionSurface = obstruction
-        domainSurfaces = self.fSurfaces + [surface[1] for surface in newSurfaces[0]]
+        domainSurfaces = self.fSurfaces + newSurfaces
 
         # creating the module volume
         surfaceLoop = gmsh.model.occ.addSurfaceLoop(domainSurfaces)
@@ -89,51 +88,8 @@ class TPZSimpleObstruction(TPZModuleTypology):
 #   ****************** 
 #        OBSTRUCTION
 #   ******************  
-    def ObstructionPoints(self) -> list[int]:
-        """
-        Returns the points belonging to the obstruction
-        """
-        cx, cy = self.fObstructionCX, self.fObstructionCY
-        r = self.fObstructionRadius
-        l = self.fLength
-        lc = self.fLC
-
-        pointsCoords = [
-            [cx, cy, l],
-            [cx + r, cy, l],
-            [cx, cy + r, l],
-            [cx - r, cy, l],
-            [cx, cy - r, l]
-        ]
-
-        return TPZGmshToolkit.CreatePoints(pointsCoords, lc)
-
-    def ObstructionArcs(self, p1:int, p2:int, p3:int, p4:int, p5:int) -> tuple[int]:
-        """
-        Returns the lines belonging to the obstruction
-        """
-        arcPoints = [
-            [p2, p1, p3],
-            [p3, p1, p4],
-            [p4, p1, p5],
-            [p5, p1, p2]
-        ]
-
-        obArcs = TPZGmshToolkit.CreateCircleArcs(arcPoints)
-
-        gmsh.model.occ.remove([(0, p1)]) # center of obstruction circle
-
-        return obArcs
-
     def CreateObstruction(self) -> int:
         """
         Returns the obstruction surface id
         """
-        obPoints = self.ObstructionPoints()
-        obArc = self.ObstructionArcs(*obPoints)
-
-        c1 = gmsh.model.occ.addCurveLoop(obArc)
-        
-        obstructionSurface = gmsh.model.occ.addPlaneSurface([c1])
-
-        return obstructionSurface
\ No newline at end of file
+        return self.CreateDisk(self.fObstructionCX, self.fObstructionCY, self.fObstructionRadius, self.fLength)
@@ -3,40 +3,89 @@ class to generate VTK files from Gmsh meshes
 
 Created by Carlos @ 09/15/2025
 """
+from typing import ClassVar, BinaryIO
+import re
+import numpy as np
+
 from src.TPZBasicDataStructure import TPZBasicDataStructure
 class TPZVtkGenerator(TPZBasicDataStructure):
+    # VTK cell type of each gmsh element type (0 if the type is not supported)
+    mshToVtk: ClassVar[np.ndarray] = np.zeros(32, dtype=np.int64)
+    mshToVtk[1] = 3 # 2 node line
+    mshToVtk[2] = 5 # 3 node triangle
+    mshToVtk[3] = 9 # 4 node quadrangle
+    mshToVtk[4] = 10 # 4 node tetrahedron
+    mshToVtk[5] = 12 # 8 node hexahedron
+    mshToVtk[7] = 14 # 5 node pyramid
+
+    # number of nodes of each gmsh element type (0 if the type is not known)
+    mshNodes: ClassVar[np.ndarray] = np.zeros(32, dtype=np.int64)
+    mshNodes[1:20] = [2, 3, 4, 4, 8, 6, 5, 3, 6, 9, 10, 27, 18, 14, 1, 8, 20, 15, 13]
+
     def __init__(self):
-        self.fPhysicalNames: list[dict] = []
         self.fEntities: dict[str, list[dict]] = {
             "nodes": [],
             "curves": [],
             "surfaces": [],
             "volumes": []
         }
-        self.fNodes: list[dict] = []
-        self.fElements: list[dict] = []
+        self.fNodeTags: np.ndarray = np.empty(0, dtype=np.int64)
+        self.fNodeCoords: np.ndarray = np.empty((0, 3))
+
+        # elements, one entry per element. The node tags and physical groups of element 'i' are 
+        # fElementNodes[fElementNodeOffsets[i]:fElementNodeOffsets[i + 1]] (same for the groups)
+        self.fElementTags: np.ndarray = np.empty(0, dtype=np.int64)
+        self.fElementDims: np.ndarray = np.empty(0, dtype=np.int64)
+        self.fElementTypes: np.ndarray = np.empty(0, dtype=np.int64)
+        self.fElementEntityTags: np.ndarray = np.empty(0, dtype=np.int64)
+        self.fElementNodeOffsets: np.ndarray = np.zeros(1, dtype=np.int64)
+        self.fElementNodes: np.ndarray = np.empty(0, dtype=np.int64) # zero-based node indexes, as VTK uses
+        self.fElementPhysicalGroupOffsets: np.ndarray = np.zeros(1, dtype=np.int64)
+        self.fElementPhysicalGroups: np.ndarray = np.empty(0, dtype=np.int64)
+
+        # element of each VTK cell (each element is written once per physical group)
+        self.fCellElements: np.ndarray = np.empty(0, dtype=np.int64)
+
+        # whether the VTK data is written in binary (big-endian, as required by the legacy format) or ASCII
+        self.fBinary: bool = False
 
         return
 
-    def ParsePhysicalNames(self, physicalLines:list[str]) -> None:
+    def FindSection(self, mesh: bytes, section: str) -> bytes:
         """
-        Parse the physical names from the mesh file
+        Return the contents between $section and $Endsection in the mesh file
 
         inputs:
-            physicalLines: lines containing the physical names
+            mesh: contents of the mesh file
+            section: name of the section (e.g., "Nodes")
         """
-        nPhysical = int(physicalLines[0])
+        # the header line may end with CRLF (files written on Windows)
+        header = re.search(rf"\${section}\r?\n".encode(), mesh)
+        if header is None:
+            self.DebugStop(f"Section ${section} not found in the mesh file")
 
-        for line in physicalLines[1:]:
-            dim, tag, name = line.split()
-            self.fPhysicalNames.append({
-                "dim": int(dim),
-                "tag": int(tag),
-                "name": name.strip()
-            })
+        start = header.end()
+        end = mesh.find(f"$End{section}".encode(), start)
+        if end < 0:
+            self.DebugStop(f"Section ${section} is not closed in the mesh file")
+
+        return mesh[start:end]
+
+    def ParseMeshFormat(self, formatData: bytes) -> None:
+        """
+        Check the mesh file format. The parsers walk the sections of the gmsh 4.1 ASCII 
+        format, so any other version or a binary file is rejected before parsing
+        inputs:
+            formatData: contents of the mesh format section (version file-type data-size)
+        """
+        # binary files have the endianness check value after the first line
+        version, fileType, _ = formatData.split(b"\n", 1)[0].split()
 
-        if len(self.fPhysicalNames) != nPhysical:
-            self.DebugStop(f"Expected {nPhysical} physical entities, but found {len(self.fPhysicalNames)}")
+        if version != b"4.1":
+            self.DebugStop(f"Mesh format version {version.decode()} not supported, only 4.1")
+
+        if fileType != b"0":
+            self.DebugStop("Binary mesh files are not supported")
 
         return
 
@@ -50,18 +99,12 @@ class TPZVtkGenerator(TPZBasicDataStructure):
         for nodeLine in nodeLines:
             nodeInfo = nodeLine.split()
 
-            nodeTagIdx = 0
-            nodeTag = int(nodeInfo[nodeTagIdx])
-            
-            coordIdx = nodeTagIdx + 1
-            x, y, z = nodeInfo[coordIdx : coordIdx + 3]
-
-            numPGIdx = coordIdx + 3
-            nodeNumPhysicalGroups = int(nodeInfo[numPGIdx])
+            # tag, coordinates and physical groups
+            nodeTag = int(nodeInfo[0])
+            x, y, z = nodeInfo[1:4]
 
-            physicalGroups = []
-            for physicalGroup in nodeInfo[numPGIdx + 1:]:
-                physicalGroups.append(int(physicalGroup))
+            nodeNumPhysicalGroups = int(nodeInfo[4])
+            physicalGroups = list(map(int, nodeInfo[5 : 5 + nodeNumPhysicalGroups]))
 
             nodes.append({
                 "tag": nodeTag,
@@ -84,24 +127,19 @@ class TPZVtkGenerator(TPZBasicDataStructure):
         for line in entityLines:
             entityInfo = line.split()
 
-            entityTagIdx = 0
-            entityTag = int(entityInfo[entityTagIdx])
+            # tag, bounding box (6 values, not used), physical groups and boundary entities
+            entityTag = int(entityInfo[0])
 
-            numPGIdx = 7
-            entityNumPhysicalGroups = int(entityInfo[numPGIdx])
+            entityNumPhysicalGroups = int(entityInfo[7])
+            physicalGroupsEnd = 8 + entityNumPhysicalGroups
 
-            physicalGroups = []
-            physicalGroupIdx = numPGIdx + 1
-            for physicalGroup in entityInfo[physicalGroupIdx : (physicalGroupIdx + entityNumPhysicalGroups)]:
-                physicalGroups.append(int(physicalGroup))
+            physicalGroups = list(map(int, entityInfo[8 : physicalGroupsEnd]))
 
-            boundaryTags = []
-            nBoundary = int(entityInfo[physicalGroupIdx + len(physicalGroups)])
-            for boundaryTag in entityInfo[physicalGroupIdx + len(physicalGroups) + 1:]:
-                boundaryTag = int(boundaryTag)
-                boundaryTag = -boundaryTag if boundaryTag < 0 else boundaryTag
+            nBoundary = int(entityInfo[physicalGroupsEnd])
+            boundaryStart = physicalGroupsEnd + 1
 
-                boundaryTags.append(boundaryTag)
+            # the sign only gives the orientation of the boundary entity
+            boundaryTags = list(map(abs, map(int, entityInfo[boundaryStart : boundaryStart + nBoundary])))
 
             entity.append({
                 "tag": entityTag,
@@ -151,72 +189,109 @@ class TPZVtkGenerator(TPZBasicDataStructure):
 
         return
 
-    def ParseNodes(self, nodeLines: list[str]) -> None:
+    def ParseNodes(self, nodeData: bytes) -> None:
         """
-        Parse the nodes from the mesh file
+        Parse the nodes from the mesh file. Each entity block has a header line 
+        (entityDim entityTag parametric numNodesInBlock), followed by the tags and 
+        then by the coordinates of its nodes. The whole section is converted at once
         inputs:
-            nodeLines: lines containing the node data
-        """
-        _, nNodes, minTag, maxTag = nodeLines[0].split()
-
-        i = 1
-        nodeTagIdxList = []
-        coordsIdxList = []
-        for i, line in enumerate(nodeLines[1:], start=1):
-            if len(line.split()) == 1:
-                nodeTagIdxList.append((i, line))
-            elif len(line.split()) == 3:
-                coordsIdxList.append((i, line))
-            
-        for nodeTag, coord in zip(nodeTagIdxList, coordsIdxList):
-            x, y, z = map(float, coord[1].split())
-            
-            self.fNodes.append({
-                "tag": int(nodeTag[1]),
-                "x": x,
-                "y": y,
-                "z": z
-            })
+            nodeData: contents of the nodes section
+        """
+        # tags are exactly represented as doubles, so a single conversion is enough
+        data = np.fromstring(nodeData, dtype=float, sep=" ")
+
+        nBlocks, nNodes, minTag, maxTag = map(int, data[:4].tolist())
+
+        tagSlices = []
+        coordSlices = []
+
+        i = 4
+        for _ in range(nBlocks):
+            _, _, parametric, numNodesInBlock = map(int, data[i : i + 4].tolist())
+
+            if parametric:
+                self.DebugStop("Parametric node coordinates are not supported")
+
+            tagsStart = i + 4
+            coordsStart = tagsStart + numNodesInBlock
+
+            tagSlices.append(data[tagsStart : coordsStart])
+            coordSlices.append(data[coordsStart : coordsStart + 3 * numNodesInBlock])
+
+            i = coordsStart + 3 * numNodesInBlock
 
-        if len(self.fNodes) != int(nNodes):
-            self.DebugStop(f"Expected {nNodes} nodes, but found {len(self.fNodes)}")
+        if i != len(data):
+            self.DebugStop(f"Expected {len(data)} values in the nodes section, but read {i}")
 
-        if int(minTag) != self.fNodes[0]['tag']:
-            self.DebugStop(f"Expected minimum node tag to be {minTag}, but found {self.fNodes[0]['tag']}")
+        self.fNodeTags = np.concatenate(tagSlices).astype(np.int64)
+        self.fNodeCoords = np.concatenate(coordSlices).reshape(-1, 3)
 
-        if int(maxTag) != self.fNodes[-1]['tag']:
-            self.DebugStop(f"Expected maximum node tag to be {maxTag}, but found {self.fNodes[-1]['tag']}")
+        if len(self.fNodeTags) != nNodes:
+            self.DebugStop(f"Expected {nNodes} nodes, but found {len(self.fNodeTags)}")
+
+        if len(self.fNodeCoords) != nNodes:
+            self.DebugStop(f"Expected {nNodes} node coordinates, but found {len(self.fNodeCoords)}")
+
+        if minTag != self.fNodeTags[0]:
+            self.DebugStop(f"Expected minimum node tag to be {minTag}, but found {self.fNodeTags[0]}")
+
+        if maxTag != self.fNodeTags[-1]:
+            self.DebugStop(f"Expected maximum node tag to be {maxTag}, but found {self.fNodeTags[-1]}")
 
         return
 
-    def ParseElements(self, elementLines: list[str]) -> None:
+    def ParseElements(self, elementData: bytes) -> None:
         """
-        Parse the elements from the mesh file
+        Parse the elements from the mesh file. The whole section is converted to 
+        integers at once, and the blocks are then walked with their headers 
+        (entityDim entityTag elementType numElementsInBlock)
         inputs:
-            elementLines: lines containing the element data
+            elementData: contents of the elements section
         """
-        i = 1
-        while i < len(elementLines) - 1:
-            elementLine = elementLines[i].split()
+        data = np.fromstring(elementData, dtype=np.int64, sep=" ")
+
+        nBlocks, nElements = data[:2].tolist()
+
+        blockDims, blockEntityTags, blockTypes, blockElements = [], [], [], []
+
+        i = 4
+        for _ in range(nBlocks):
+            elDim, elEntityTag, elType, numElBlock = data[i : i + 4].tolist()
+
+            nNodes = int(self.mshNodes[elType]) if elType < len(self.mshNodes) else 0
+            if not nNodes:
+                self.DebugStop(f"Element type {elType} not recognized")
+
+            # every element of the block has the same type, so the block is a (numElBlock, 1 + nNodes) table
+            blockStart = i + 4
+            blockEnd = blockStart + numElBlock * (1 + nNodes)
+
+            blockDims.append(elDim)
+            blockEntityTags.append(elEntityTag)
+            blockTypes.append(elType)
+            blockElements.append(data[blockStart : blockEnd].reshape(numElBlock, 1 + nNodes))
+
+            i = blockEnd
 
-            if len(elementLine) != 4:
-                i += 1
-                continue
+        if i != len(data):
+            self.DebugStop(f"Expected {len(data)} values in the elements section, but read {i}")
 
-            elDim, elEntityTag, elType, numElBlock = map(int, elementLine)
+        blockSizes = [len(block) for block in blockElements]
+        blockNodes = [block.shape[1] - 1 for block in blockElements]
 
-            for _ in elementLines[i + 1 : i + 1 + numElBlock]:
-                elementTag, *nodeTags = map(int, _.split())
+        self.fElementTags = np.concatenate([block[:, 0] for block in blockElements])
+        self.fElementDims = np.repeat(blockDims, blockSizes).astype(np.int64)
+        self.fElementTypes = np.repeat(blockTypes, blockSizes).astype(np.int64)
+        self.fElementEntityTags = np.repeat(blockEntityTags, blockSizes).astype(np.int64)
 
-                self.fElements.append({
-                    "tag": elementTag,
-                    "dim": elDim,
-                    "type": elType,
-                    "nodeTags": nodeTags,
-                    "entityTag": elEntityTag
-                })
+        self.fElementNodeOffsets = np.zeros(len(self.fElementTags) + 1, dtype=np.int64)
+        np.cumsum(np.repeat(blockNodes, blockSizes), out=self.fElementNodeOffsets[1:])
+        # node tags start at 1, so they are shifted once here to the zero-based indexes used by VTK
+        self.fElementNodes = np.concatenate([block[:, 1:].ravel() for block in blockElements])
+        self.fElementNodes -= 1
 
-            i += 1 + numElBlock
+        if len(self.fElementTags) != nElements:
+            self.DebugStop(f"Expected {nElements} elements, but found {len(self.fElementTags)}")
                 
         return
 
@@ -224,83 +299,146 @@ class TPZVtkGenerator(TPZBasicDataStructure):
         """
         Merge the entities and elements data
         """
-        for element in self.fElements:
-            elEntityTag = element['entityTag']
-            elDim = element['dim']
+        entityKeys = ['nodes', 'curves', 'surfaces', 'volumes']
+
+        # physical groups of each (dim, entity tag), so every lookup is a single hash
+        entityGroups = {
+            (dim, e['tag']): e['physicalGroups'] 
+            for dim, key in enumerate(entityKeys) for e in self.fEntities[key]
+        }
+
+        # the elements of an entity are contiguous (one block per entity), so the 
+        # physical groups are looked up once per run of elements of the same entity
+        dims, entityTags = self.fElementDims, self.fElementEntityTags
+
+        newRun = np.ones(len(dims), dtype=bool)
+        newRun[1:] = (dims[1:] != dims[:-1]) | (entityTags[1:] != entityTags[:-1])
+
+        runStarts = np.flatnonzero(newRun)
+        runSizes = np.diff(np.append(runStarts, len(dims)))
+
+        runGroups = []
+        for elDim, elEntityTag in zip(dims[runStarts].tolist(), entityTags[runStarts].tolist()):
+            groups = entityGroups.get((elDim, elEntityTag))
+
+            if groups is None:
+                self.DebugStop(f"Entity {elEntityTag} of dimension {elDim} not found")
+
+            runGroups.append(np.array(groups, dtype=np.int64))
+
+        self.fElementPhysicalGroupOffsets = np.zeros(len(dims) + 1, dtype=np.int64)
+        np.cumsum(np.repeat([len(groups) for groups in runGroups], runSizes), out=self.fElementPhysicalGroupOffsets[1:])
+        self.fElementPhysicalGroups = np.concatenate([np.tile(groups, size) for groups, size in zip(runGroups, runSizes.tolist())])
+
+        # the cells are expanded once here and shared by all the VTK sections
+        self.fCellElements = np.repeat(np.arange(len(dims)), np.diff(self.fElementPhysicalGroupOffsets))
+
+        return
+
+    @staticmethod
+    def FormatTable(table: np.ndarray, valueFormat: str) -> str:
+        """
+        Format a 2D array as text, one row per line and the values separated by spaces. 
+        The whole table goes through a single %-formatting call
+        inputs:
+            table: 2D array to be formatted
+            valueFormat: %-format of each value (e.g., "%d")
+        """
+        nRows, nColumns = table.shape
 
-            if elDim == 0:
-                entityList = self.fEntities['nodes']
-            
-            elif elDim == 1:
-                entityList = self.fEntities['curves']
-            
-            elif elDim == 2:
-                entityList = self.fEntities['surfaces']
-            
-            elif elDim == 3:
-                entityList = self.fEntities['volumes']
+        rowFormat = " ".join([valueFormat] * nColumns) + "\n"
 
-            element['physicalGroups'] = next(e['physicalGroups'] for e in entityList if e['tag'] == elEntityTag)
+        return (rowFormat * nRows) % tuple(table.ravel().tolist())
+
+    def WriteData(self, vtkFile: BinaryIO, table: np.ndarray, valueFormat: str, binaryType: str) -> None:
+        """
+        Write a 2D array of VTK data, as text or as big-endian binary values
+        inputs:
+            vtkFile: open VTK file
+            table: 2D array to be written, one row per line in ASCII files
+            valueFormat: %-format of each value in ASCII files (e.g., "%d")
+            binaryType: type of each value in binary files (e.g., ">i4")
+        """
+        if self.fBinary:
+            vtkFile.write(table.astype(binaryType).tobytes())
+        else:
+            vtkFile.write(self.FormatTable(table, valueFormat).encode())
 
         return
 
-    def WriteVTKPointData(self) -> None:
+    def WriteVTKPointData(self, vtkFile: BinaryIO) -> None:
         """
         Write the points data in VTK format
+        inputs:
+            vtkFile: open VTK file
         """
-        pointData = ""
+        nPoints = len(self.fNodeCoords)
+
+        vtkFile.write(f"POINTS {nPoints} double \n".encode())
 
-        point = 0
-        for node in self.fNodes:
-            pointData += f"{node['x']} {node['y']} {node['z']}\n"
-            point += 1
+        # %r keeps the shortest representation that round-trips each coordinate
+        self.WriteData(vtkFile, self.fNodeCoords, "%r", ">f8")
 
-        return f"POINTS {point} double \n" + pointData + "\n"
+        vtkFile.write(b"\n")
+
+        return
 
-    def WriteVTKCellData(self) -> None:
+    def WriteVTKCellData(self, vtkFile: BinaryIO) -> None:
         """
         Write the cell data in VTK format
+        inputs:
+            vtkFile: open VTK file
         """
-        cellData = ""
+        cellElements = self.fCellElements
+        nodeOffsets = self.fElementNodeOffsets
+        cellNodeCounts = np.diff(nodeOffsets)[cellElements]
+
+        nCells = len(cellElements)
+        totalNumIndices = int(cellNodeCounts.sum())
+
+        vtkFile.write(f"CELLS {nCells} {totalNumIndices + nCells}\n".encode())
+
+        # elements of the same type are contiguous, so the cells are formatted in runs with the same number of nodes
+        runStarts = np.flatnonzero(np.diff(cellNodeCounts, prepend=-1))
+        runEnds = np.append(runStarts[1:], nCells)
 
-        nCells, totalNumIndices = 0, 0
-        for element in self.fElements:
-            for _ in element['physicalGroups']:
-                nNodes = len(element['nodeTags'])
+        for start, end in zip(runStarts.tolist(), runEnds.tolist()):
+            nNodes = int(cellNodeCounts[start])
 
-                cellData += f"{nNodes}" 
-                for nodeTag in element['nodeTags']:
-                    cellData += f" {nodeTag - 1}"  # VTK uses zero-based indexing
-                cellData += "\n"
+            # position of each node of the run's cells in fElementNodes
+            nodeIndexes = nodeOffsets[cellElements[start:end], None] + np.arange(nNodes)
 
-                nCells += 1
-                totalNumIndices += nNodes
+            cells = np.empty((end - start, nNodes + 1), dtype=np.int64)
+            cells[:, 0] = nNodes
+            cells[:, 1:] = self.fElementNodes[nodeIndexes]
 
-        return f"CELLS {nCells} {totalNumIndices + nCells}\n" + cellData + "\n"
+            self.WriteData(vtkFile, cells, "%d", ">i4")
 
-    def WriteVTKCellTypes(self) -> None:
+        vtkFile.write(b"\n")
+
+        return
+
+    def WriteVTKCellTypes(self, vtkFile: BinaryIO) -> None:
         """
         Write the cell types in VTK format
+        inputs:
+            vtkFile: open VTK file
         """
-        mshToVtk = {
-            1 : 3, # 2 node line
-            2 : 5, # 3 node triangle
-            3 : 9, # 4 node quadrangle
-            4 : 10, # 4 node tetrahedron
-            5 : 12, # 8 node hexahedron
-            7 : 14, # 5 node pyramid 
-        } 
+        mshTypes = self.fElementTypes
+
+        unsupported = [t for t in np.unique(mshTypes).tolist() if t >= len(self.mshToVtk) or not self.mshToVtk[t]]
+        if unsupported:
+            self.DebugStop(f"Element types {unsupported} not supported")
 
-        cellTypes = ""
-        nTypes = 0
-        for element in self.fElements:
-            for _ in element['physicalGroups']:
-                vtkType = element['type']
+        vtkTypes = self.mshToVtk[mshTypes[self.fCellElements]]
 
-                cellTypes += f"{mshToVtk[vtkType]}\n"
-                nTypes += 1
+        nTypes = len(vtkTypes)
 
-        return f"CELL_TYPES {nTypes}\n" + cellTypes + "\n"
+        vtkFile.write(f"CELL_TYPES {nTypes}\n".encode())
+        self.WriteData(vtkFile, vtkTypes[:, None], "%d", ">i4")
+        vtkFile.write(b"\n")
+
+        return
 
     def nSolutions(self, field:str) -> int:
         """
@@ -311,63 +449,76 @@ class TPZVtkGenerator(TPZBasicDataStructure):
         if field == "MaterialID": return 1, "SCALARS"
         else: self.DebugStop(f"Field '{field}' not recognized")
 
-    def Solution(self, field:str) -> str:
+    def Solution(self, field:str) -> np.ndarray:
         """
-        Return the solution data for a given field. Implement more if needed
+        Return the solution data for a given field, one value per cell. Implement more if needed
         inputs:
             field: name of the field (e.g., "MaterialID")
         """
-        fieldData = ""
         if field == "MaterialID":
-            nElements = 0
-            for element in self.fElements:
-                for physicalGroup in element['physicalGroups']:
-                    fieldData += f"{physicalGroup}\n"
-                    nElements += 1
+            # the physical groups are stored element by element, as the cells are written
+            fieldData = self.fElementPhysicalGroups
+        else: self.DebugStop(f"Field '{field}' not recognized")
 
-        return fieldData, nElements
+        return fieldData
 
-    def WriteVTKHeader(self, fields: list[str]) -> None:
+    def WriteVTKHeader(self, vtkFile: BinaryIO, fields: list[str]) -> None:
         """
         Write the VTK header
+        inputs:
+            vtkFile: open VTK file
+            fields: list of fields to be included in the VTK file (e.g., ["MaterialID"])
         """
-        for field in fields:
+        if not fields:
+            return
+
+        # each field is computed and written once, even if it is requested more than once
+        solutions = {field: self.Solution(field) for field in dict.fromkeys(fields)}
+
+        vtkFile.write(f"CELL_DATA {len(self.fCellElements)}\n".encode())
+
+        for i, (field, data) in enumerate(solutions.items()):
             fieldSize, fieldType = self.nSolutions(field)
-            fieldData, nElements = self.Solution(field)
 
-            text = f"CELL_DATA {nElements}\n"
-            text += f"{fieldType} MaterialID int {fieldSize}\n"
+            if i > 0:
+                vtkFile.write(b"\n") # ends the previous data, as required after binary values
+
+            text = f"{fieldType} {field} int {fieldSize}\n"
             text += "LOOKUP_TABLE default\n"
-            text += f"{fieldData}"
 
-        return text 
+            vtkFile.write(text.encode())
+            self.WriteData(vtkFile, data[:, None], "%d", ">i4")
 
-    def WriteVTK(self, vtkFileName: str, fields: list[str]) -> None:
+        return
+
+    def WriteVTK(self, vtkFileName: str, fields: list[str], binary: bool = False) -> None:
         """
         Write the VTK file
         inputs:
             vtkFileName: name of the output VTK file (without extension)
             fields: list of fields to be included in the VTK file (e.g., ["MaterialID"])
+            binary: whether the data is written in binary instead of ASCII
         """
-        text = "# vtk DataFile Version 2.0\n"
-        text += "Created by Gmsh 4.13.1\n"
-        text += "ASCII\n"
-        text += "DATASET UNSTRUCTURED_GRID\n"
+        self.fBinary = binary
 
-        text += self.WriteVTKPointData()
+        # each section is written as soon as it is formatted, instead of building the whole file in memory
+        with open(f"{vtkFileName}.vtk", "wb", buffering=1 << 20) as f:
+            f.write(b"# vtk DataFile Version 2.0\n")
+            f.write(b"Created by Gmsh 4.13.1\n")
+            f.write(b"BINARY\n" if binary else b"ASCII\n")
+            f.write(b"DATASET UNSTRUCTURED_GRID\n")
 
-        text += self.WriteVTKCellData()
+            self.WriteVTKPointData(f)
 
-        text += self.WriteVTKCellTypes()
+            self.WriteVTKCellData(f)
 
-        text += self.WriteVTKHeader(fields)
+            self.WriteVTKCellTypes(f)
 
-        with open(f"{vtkFileName}.vtk", "w") as f:
-            f.write(text)
+            self.WriteVTKHeader(f, fields)
 
         return
 
-    def Do(self, outputFile: str, meshFile: str, fields: list[str]) -> None:
+    def Do(self, outputFile: str, meshFile: str, fields: list[str], binary: bool = False) -> None:
         """
         Main method to generate the VTK file from a Gmsh mesh file
 
@@ -375,29 +526,20 @@ class TPZVtkGenerator(TPZBasicDataStructure):
             outputFile: name of the output file (without extension)
             meshFile: name of the Gmsh mesh file (with extension)
             fields: list of fields to be included in the VTK file (e.g., ["MaterialID"])
+            binary: whether the VTK data is written in binary instead of ASCII
         """
-        with open(meshFile, "r") as f:
-                lines = f.readlines()
-
-        physicalNamesStart = lines.index("$PhysicalNames\n")
-        physicalNamesEnd = lines.index("$EndPhysicalNames\n")
-
-        entitiesStart = lines.index("$Entities\n")
-        entitiesEnd = lines.index("$EndEntities\n")
-
-        nodesStart = lines.index("$Nodes\n")
-        nodesEnd = lines.index("$EndNodes\n")
+        # the file is read at once and each section is located with a single scan of the bytes
+        with open(meshFile, "rb") as f:
+            mesh = f.read()
 
-        elementsStart = lines.index("$Elements\n")
-        elementsEnd = lines.index("$EndElements\n")
+        self.ParseMeshFormat(self.FindSection(mesh, "MeshFormat"))
 
-        self.ParsePhysicalNames(lines[physicalNamesStart + 1: physicalNamesEnd])
-        self.ParseEntities(lines[entitiesStart + 1: entitiesEnd])
-        self.ParseNodes(lines[nodesStart + 1: nodesEnd])
-        self.ParseElements(lines[elementsStart + 1: elementsEnd])
+        self.ParseEntities(self.FindSection(mesh, "Entities").decode().splitlines(keepends=True))
+        self.ParseNodes(self.FindSection(mesh, "Nodes"))
+        self.ParseElements(self.FindSection(mesh, "Elements"))
 
         self.MergeEntityAndElements()
 
-        self.WriteVTK(outputFile, fields)
+        self.WriteVTK(outputFile, fields, binary)
 
         return
\ No newline at end of file